@@ -26,8 +26,12 @@ class BossScraper:
         self.username = username
         self.password = password
         self.totp_secret = totp_secret
+        # TOTP.__init__ parses the secret and sets up HMAC; build it once
+        # here instead of per login (matters for batched scrapes).
+        self._totp = pyotp.TOTP(totp_secret) if totp_secret else None
         self.driver = None
         self.wait = None
+        self._http = None
         
         if not os.path.exists(DEBUG_DIR):
             os.makedirs(DEBUG_DIR, exist_ok=True)
@@ -71,8 +75,10 @@ class BossScraper:
         chrome_options.add_argument("--blink-settings=imagesEnabled=false")
         
         # Performance Flag: Reuse user data dir for session caching
-        # We use a subfolder in DEBUG_DIR for BOSS specifically
-        boss_session_dir = os.path.join(DEBUG_DIR, "boss_session")
+        # We use a per-user subfolder in DEBUG_DIR so parallel workers never
+        # fight over the same Chrome profile lock.
+        safe_user = "".join(c if c.isalnum() else "_" for c in self.username)
+        boss_session_dir = os.path.join(DEBUG_DIR, f"boss_session_{safe_user}")
         if not os.path.exists(boss_session_dir):
             os.makedirs(boss_session_dir, exist_ok=True)
         chrome_options.add_argument(f"--user-data-dir={boss_session_dir}")
@@ -231,8 +237,7 @@ class BossScraper:
             if not self.totp_secret:
                 raise Exception("2FA required but no TOTP secret provided.")
             
-            totp = pyotp.TOTP(self.totp_secret)
-            token = totp.now()
+            token = self._totp.now()
             logger.info("Generated TOTP token.")
             
             # Robust Token Input Field
@@ -395,16 +400,23 @@ class BossScraper:
              logger.warning("Grade table not immediately visible, checking for further links.")
         
 
-    def _fetch_page_via_requests(self, url):
-        """Fetch a page using httpx by reusing Selenium cookies."""
-        logger.info(f"Fetching {url} via httpx...")
-        
+    def _sync_http_client(self):
+        """(Re)build the shared httpx client from current Selenium cookies.
+
+        Doing this once after login lets every subsequent page fetch go
+        through httpx without re-extracting cookies or re-creating the
+        client (and its connection pool) per request.
+        """
+        if self._http is not None:
+            try: self._http.close()
+            except: pass
+
         # Extract cookies from Selenium
         selenium_cookies = self.driver.get_cookies()
         jar = httpx.Cookies()
         for cookie in selenium_cookies:
             jar.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''))
-            
+
         user_agent = self.driver.execute_script("return navigator.userAgent")
         headers = {
             "User-Agent": user_agent,
@@ -413,12 +425,25 @@ class BossScraper:
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1"
         }
-        
+
+        self._http = httpx.Client(cookies=jar, headers=headers, timeout=20.0, follow_redirects=True)
+
+    def _close_http_client(self):
+        if self._http is not None:
+            try: self._http.close()
+            except: pass
+            self._http = None
+
+    def _fetch_page_via_requests(self, url):
+        """Fetch a page using httpx by reusing Selenium cookies."""
+        logger.info(f"Fetching {url} via httpx...")
+
         try:
-            with httpx.Client(cookies=jar, headers=headers, timeout=20.0, follow_redirects=True) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                return response.text
+            if self._http is None:
+                self._sync_http_client()
+            response = self._http.get(url)
+            response.raise_for_status()
+            return response.text
         except Exception as e:
             logger.error(f"Failed to fetch via httpx: {e}")
             return None
@@ -473,6 +498,7 @@ class BossScraper:
             self._dump_debug_info("scraper_failure")
             return {"error": str(e)}
         finally:
+            self._close_http_client()
             if self.driver:
                 self.driver.quit()
 
@@ -1,16 +1,78 @@
+import json
 import logging
+import os
+import re
 import time
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from urllib.parse import urljoin, urlparse
+import httpx
+import lxml.etree
+import lxml.html
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from app.scrapers.boss_scraper import BossScraper
+from app.utils.webdriver_utils import DEBUG_DIR, driver_pool
+
+try:
+    # Optional fast path: Lexbor keeps the parsed tree in C memory and only
+    # materializes Python objects on access (~10x faster than BeautifulSoup).
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns: extraction runs them once per node/link, so compile
+# (and lowercase the junk substrings) once at import time instead.
+_WS_RE = re.compile(r'\s+')
+_ID_RE = re.compile(r'\d{4,6}')
+# Try specific user target first, then fallback to generic regex
+_SEMESTER_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r"Wintersemester\s*2025/26",
+    r"(Wintersemester|Sommersemester)\s*\d{4}(/\d{2})?"
+)]
+# Reusable parser fixture and compiled XPaths for the lxml fallback:
+# constructing these per call is pure overhead for a fixed page schema.
+# Must be lxml.html.HTMLParser (not etree): only the html parser yields
+# HtmlElement nodes with text_content().
+_HTML_PARSER = lxml.html.HTMLParser(recover=True)
+_MARKER_XP = lxml.etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' Leistungen_Inhalt ')]")
+_MARKER_OR_ANCHOR_XP = lxml.etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' Leistungen_Inhalt ')] | //a")
+_JUNK_LC = tuple(j.lower() for j in (
+    "Tag", "Zeit", "Rhythmus", "Dauer", "Raum", "Lehrperson", "Hinweis",
+    "Belegungsinformation", "findet statt", "Belegungs-", "PDF",
+    "Stundenplan", "Anmelden", "Login", "Abmelden"
+))
+
+
+def _normalize(t):
+    return _WS_RE.sub(' ', t).strip()
+
+
+# Winning SSO locators per (domain, field). The IdP markup is stable, so
+# after the first login we try the cached locator first instead of paying
+# a failed WebDriver round-trip per strategy on every login.
+_LOCATOR_CACHE = {}
+
+def _safe_name(username):
+    """Filesystem-safe slug for per-user session artifacts."""
+    return re.sub(r'\W', '_', username)
+
 class LsfScraper(BossScraper):
     def __init__(self, username, password, totp_secret=None):
         super().__init__(username, password, totp_secret)
         self.lsf_url = "https://www.lsf.tu-dortmund.de/qisserver/rds?state=wscheck&wscheck=leistungen&navigationPosition=functions%2CmyLecturesWScheck&breadcrumb=myLectures&topitem=functions&subitem=myLecturesWScheck"
+        # Per-user cookie file: while the cookies stay valid the whole scrape
+        # is a single httpx GET with no browser involved, and parallel
+        # workers never write to the same file.
+        self._cookie_file = os.path.join(DEBUG_DIR, f"lsf_cookies_{_safe_name(username)}.json")
+        # True once the HTTP 2FA POST actually fired; the final login check
+        # must then prove authentication, not just the LSF URL.
+        self._totp_post_fired = False
 
     def login(self):
         """Override login to start at LSF domain."""
@@ -21,15 +83,20 @@ class LsfScraper(BossScraper):
         logger.info("LSF-SPECIFIC LOGIN SEQUENCE STARTED")
         
         # 1. Faster Check: Am I already logged in?
+        # URL and element-presence checks only: page_source serializes the
+        # whole rendered DOM over the WebDriver wire on every poll tick.
         try:
-            self.wait.until(lambda d: "sso.itmc" in d.current_url or "Abmelden" in d.page_source or "Anmelden" in d.page_source or "Login" in d.page_source)
+            self.wait.until(EC.any_of(
+                EC.url_contains("sso.itmc"),
+                EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, "Abmelden")),
+                EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, "Anmelden")),
+                EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, "Login"))))
         except:
             pass
 
         current_url = self.driver.current_url
-        page_source = self.driver.page_source
 
-        if "lsf.tu-dortmund.de" in current_url and "Abmelden" in page_source:
+        if "lsf.tu-dortmund.de" in current_url and self.driver.find_elements(By.PARTIAL_LINK_TEXT, "Abmelden"):
             logger.info("Session resumed (already logged in to LSF)")
             return True
             
@@ -60,10 +127,7 @@ class LsfScraper(BossScraper):
         """Save screenshot and HTML for debugging."""
         if not self.driver: return
         try:
-            from datetime import datetime
-            import os
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            from app.utils.webdriver_utils import DEBUG_DIR
             base_path = os.path.join(DEBUG_DIR, f"{prefix}_{timestamp}")
             self.driver.save_screenshot(f"{base_path}.png")
             with open(f"{base_path}.html", "w", encoding="utf-8") as f:
@@ -72,59 +136,144 @@ class LsfScraper(BossScraper):
         except Exception as e:
             logger.error(f"Failed to dump debug info: {e}")
 
+    def _js_set(self, el, value):
+        """Set an input's value in one script call instead of one WebDriver
+        round-trip per character, firing input/change so the IdP's JS sees it."""
+        self.driver.execute_script(
+            "arguments[0].value=arguments[1];"
+            "arguments[0].dispatchEvent(new Event('input',{bubbles:true}));"
+            "arguments[0].dispatchEvent(new Event('change',{bubbles:true}));",
+            el, value)
+
+    def _find_displayed(self, field, strategies):
+        """Find the first displayed element for a login field, trying the
+        cached winning locator for this domain before the strategy list."""
+        key = (urlparse(self.driver.current_url).netloc, field)
+        cached = _LOCATOR_CACHE.get(key)
+        if cached:
+            try:
+                el = self.driver.find_element(*cached)
+                if el.is_displayed():
+                    return el
+            except: pass
+
+        # One compound wait for any strategy to become visible, so a slow
+        # page load does not burn a failed round-trip per locator.
+        try:
+            self.wait.until(EC.any_of(*[EC.visibility_of_element_located(s) for s in strategies]))
+        except: pass
+
+        for strategy in strategies:
+            try:
+                el = self.driver.find_element(*strategy)
+                if el.is_displayed():
+                    _LOCATOR_CACHE[key] = strategy
+                    return el
+            except: continue
+        return None
+
+    def _submit_totp_via_http(self, token):
+        """Complete the 2FA step with a direct POST to the Shibboleth form.
+
+        Skips a full browser round trip (render + polling window) by
+        posting the token straight to the form action with the current
+        session cookies. Returns True if the IdP redirected back to LSF;
+        False means the caller should use the Selenium flow instead.
+        """
+        try:
+            form = self.driver.find_element(By.TAG_NAME, "form")
+            action = form.get_attribute("action")
+            if not action:
+                return False
+
+            # One outerHTML fetch covers the action and all hidden inputs.
+            form_root = lxml.html.fromstring(form.get_attribute("outerHTML"), parser=_HTML_PARSER)
+            data = {}
+            for inp in form_root.xpath(".//input"):
+                name = inp.get("name")
+                if name:
+                    data[name] = inp.get("value") or ""
+
+            token_keys = [k for k in data if k in ("j_token", "token", "otp")]
+            if token_keys:
+                for k in token_keys:
+                    data[k] = token
+            else:
+                data["j_token"] = token
+            data.setdefault("_eventId_proceed", "")
+
+            jar = httpx.Cookies()
+            for cookie in self.driver.get_cookies():
+                jar.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''))
+
+            action = urljoin(self.driver.current_url, action)
+            # Explicit client: its jar accumulates Set-Cookie headers from
+            # every redirect hop (the SP session cookie is typically issued
+            # mid-chain and would be missing from response.cookies).
+            with httpx.Client(cookies=jar, timeout=20.0, follow_redirects=True) as client:
+                # From here on the token may be consumed at the IdP and the
+                # driver may get navigated away from the form.
+                self._totp_post_fired = True
+                response = client.post(action, data=data)
+                if "lsf.tu-dortmund.de" not in str(response.url):
+                    return False
+                session_cookies = list(client.cookies.jar)
+
+            # Transfer the post-2FA session cookies back into Selenium so
+            # the browser session stays usable (pooling, debug dumps).
+            self.driver.get(self.lsf_url)
+            for c in session_cookies:
+                try:
+                    self.driver.add_cookie({"name": c.name, "value": c.value, "path": c.path})
+                except: continue
+
+            # Only report success once the browser session itself is
+            # authenticated; httpx reaching LSF is not enough on its own.
+            self.driver.get(self.lsf_url)
+            try:
+                self.wait.until(EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, "Abmelden")))
+            except:
+                logger.info("HTTP 2FA POST did not authenticate the browser session")
+                return False
+            logger.info("2FA completed via direct HTTP POST")
+            return True
+        except Exception as e:
+            logger.info(f"HTTP 2FA submit not possible, using browser flow: {e}")
+            return False
+
     def _inject_sso_credentials(self):
         """Robust SSO injection logic ported from BossScraper."""
         logger.info("Injecting SSO credentials...")
+        self._totp_post_fired = False
         try:
             # 1. Wait for SSO or target
-            self.wait.until(lambda d: "sso.itmc" in d.current_url or "lsf.tu-dortmund.de" in d.current_url)
+            self.wait.until(EC.any_of(EC.url_contains("sso.itmc"), EC.url_contains("lsf.tu-dortmund.de")))
             
-            if "lsf.tu-dortmund.de" in self.driver.current_url and "Abmelden" in self.driver.page_source:
+            # find_elements returns an empty list cheaply; no need to pull
+            # the serialized page_source over the wire for a substring check.
+            if "lsf.tu-dortmund.de" in self.driver.current_url and self.driver.find_elements(By.PARTIAL_LINK_TEXT, "Abmelden"):
                 return True
 
             # 2. Username Strategy
-            user_field = None
-            for strategy in [(By.ID, "username"), (By.NAME, "j_username"), (By.CSS_SELECTOR, "input#idToken1"), (By.CSS_SELECTOR, "input[type='text']")]:
-                try:
-                    el = self.driver.find_element(*strategy)
-                    if el.is_displayed():
-                        user_field = el
-                        break
-                except: continue
-            
+            user_field = self._find_displayed("username", [(By.ID, "username"), (By.NAME, "j_username"), (By.CSS_SELECTOR, "input#idToken1"), (By.CSS_SELECTOR, "input[type='text']")])
+
             if not user_field:
                 self._dump_debug_info("lsf_login_no_user")
                 raise Exception("Username field not found")
             
-            user_field.clear()
-            user_field.send_keys(self.username)
+            self._js_set(user_field, self.username)
             
             # 3. Password Strategy
-            pass_field = None
-            for strategy in [(By.ID, "password"), (By.NAME, "j_password"), (By.CSS_SELECTOR, "input#idToken2"), (By.CSS_SELECTOR, "input[type='password']")]:
-                try:
-                    el = self.driver.find_element(*strategy)
-                    if el.is_displayed():
-                        pass_field = el
-                        break
-                except: continue
-                
+            pass_field = self._find_displayed("password", [(By.ID, "password"), (By.NAME, "j_password"), (By.CSS_SELECTOR, "input#idToken2"), (By.CSS_SELECTOR, "input[type='password']")])
+
             if not pass_field:
                 raise Exception("Password field not found")
             
-            pass_field.clear()
-            pass_field.send_keys(self.password)
+            self._js_set(pass_field, self.password)
             
             # 4. Submit Strategy
-            submit_btn = None
-            for strategy in [(By.NAME, "_eventId_proceed"), (By.ID, "loginButton_0"), (By.CSS_SELECTOR, "button[type='submit']"), (By.CSS_SELECTOR, "input[type='submit']")]:
-                try:
-                    el = self.driver.find_element(*strategy)
-                    if el.is_displayed():
-                        submit_btn = el
-                        break
-                except: continue
-                
+            submit_btn = self._find_displayed("submit", [(By.NAME, "_eventId_proceed"), (By.ID, "loginButton_0"), (By.CSS_SELECTOR, "button[type='submit']"), (By.CSS_SELECTOR, "input[type='submit']")])
+
             if submit_btn:
                 submit_btn.click()
             else:
@@ -132,35 +281,43 @@ class LsfScraper(BossScraper):
             
             # 5. Handle 2FA
             try:
-                # Wait for 2FA field or success
-                self.wait.until(lambda d: "token" in d.page_source.lower() or "otp" in d.page_source.lower() or "lsf.tu-dortmund.de" in d.current_url)
-                
-                if ("token" in self.driver.page_source.lower() or "otp" in self.driver.page_source.lower()) and self.totp_secret:
+                # Wait for 2FA field or success. Waiting on the actual input
+                # element avoids lowercasing a full page_source copy (easily
+                # megabytes of allocation) on every poll tick.
+                self.wait.until(EC.any_of(
+                    EC.presence_of_element_located((By.ID, "token")),
+                    EC.presence_of_element_located((By.NAME, "otp")),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[inputmode='numeric']")),
+                    EC.url_contains("lsf.tu-dortmund.de")))
+
+
+                if self.totp_secret and self.driver.find_elements(By.CSS_SELECTOR, "input[inputmode='numeric'], input[name='otp'], #token"):
                     logger.info("2FA Code Required...")
-                    import pyotp
-                    totp = pyotp.TOTP(self.totp_secret)
-                    token = totp.now()
-                    
-                    token_field = None
-                    for strategy in [(By.ID, "token"), (By.NAME, "otp"), (By.CSS_SELECTOR, "input[inputmode='numeric']")]:
-                        try:
-                            el = self.driver.find_element(*strategy)
-                            if el.is_displayed():
-                                token_field = el
-                                break
-                        except: continue
-                    
-                    if token_field:
-                        token_field.send_keys(token)
-                        # Find 2FA proceed button
-                        try:
-                            self.driver.find_element(By.NAME, "_eventId_proceed").click()
-                        except:
-                            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+                    token = self._totp.now()
+
+                    # Fast path: POST the token straight to the Shibboleth
+                    # endpoint; only drive the browser form if that fails
+                    # AND the form is still pending — the POST may already
+                    # have consumed this token at the IdP.
+                    if not self._submit_totp_via_http(token) and self.driver.find_elements(By.CSS_SELECTOR, "input[inputmode='numeric'], input[name='otp'], #token"):
+                        token_field = self._find_displayed("token", [(By.ID, "token"), (By.NAME, "otp"), (By.CSS_SELECTOR, "input[inputmode='numeric']")])
+
+                        if token_field:
+                            self._js_set(token_field, token)
+                            # Find 2FA proceed button
+                            try:
+                                self.driver.find_element(By.NAME, "_eventId_proceed").click()
+                            except:
+                                self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
             except: pass
 
             # 6. Final success check
             self.wait.until(EC.url_contains("lsf.tu-dortmund.de"))
+            # If the HTTP 2FA POST fired, _submit_totp_via_http may have
+            # parked the driver on an unauthenticated LSF page, so the URL
+            # check above passes trivially - require the Abmelden link too.
+            if self._totp_post_fired and not self.driver.find_elements(By.PARTIAL_LINK_TEXT, "Abmelden"):
+                raise Exception("2FA POST did not produce an authenticated session")
             logger.info("Successfully logged in to LSF.")
             return True
         except Exception as e:
@@ -173,126 +330,219 @@ class LsfScraper(BossScraper):
         Extract classes for the current semester (e.g. Wintersemester 2025/26).
         The layout is assumed to be:
           <div class="Leistungen_Inhalt">Semester Name</div>
-          ... 
+          ...
           <a href="...">Class Link</a>
           ...
           <div class="Leistungen_Inhalt">Next Semester</div>
+
+        Parsing uses selectolax/Lexbor when installed (the tree lives in C
+        memory and Python objects only materialize on access); falls back
+        to lxml with a pooled parser otherwise.
         """
-        import re
-        def normalize(t):
-            return re.sub(r'\s+', ' ', t).strip()
+        if LexborHTMLParser is not None:
+            candidate_links = self._collect_candidates_lexbor(html_content)
+        else:
+            candidate_links = self._collect_candidates_lxml(html_content)
+
+        if candidate_links is None:
+            logger.warning("Could not find current semester header (e.g. Wintersemester 2025/26)")
+            # Fallback check for old marker if new one fails
+            if "Aktuelle Veranstaltungen" in html_content:
+                 logger.info("Fallback to 'Aktuelle Veranstaltungen' marker")
+                 return self._legacy_extract(html_content)
+            return []
+
+        # 3. Process candidates (link texts are already normalized).
+        # A single insertion-ordered dict does the dedup; no separate
+        # seen-set to probe alongside the result list.
+        classes = {}
+
+        for link_text in candidate_links:
+            # Candidates already matched the course-id pattern at collection
+            # time; only the junk and length filters remain.
+            if len(link_text) < 5:
+                continue
+
+            # Junk Filters (lowercase the link text once, not once per substring)
+            lt_lc = link_text.lower()
+            if any(j in lt_lc for j in _JUNK_LC):
+                continue
+
+            if link_text not in classes:
+                classes[link_text] = None
+                logger.info(f"✅ FOUND CLASS: {link_text}")
+
+        logger.info(f"Total classes found for semester: {len(classes)}")
+        return list(classes)
+
+    def _collect_candidates_lexbor(self, html_content):
+        """
+        Collect normalized link texts between the current semester header
+        and the next 'Leistungen_Inhalt' div using selectolax/Lexbor.
+        Returns None if no semester header matched.
+        """
+        tree = LexborHTMLParser(html_content)
+
+        # 1. Find the start marker (Current Semester)
+        start_text = None
+        headers = tree.css("div.Leistungen_Inhalt")
+        for p in _SEMESTER_RES:
+            for header in headers:
+                txt = _normalize(header.text(deep=True))
+                if p.search(txt):
+                    start_text = txt
+                    logger.info(f"Found semester header: {txt}")
+                    break
+            if start_text: break
+
+        if start_text is None:
+            return None
+
+        # 2. Let the Lexbor CSS engine pre-select only semester markers and
+        # anchors (document order); Python then walks just the slice between
+        # the matched header and the next marker instead of every tree node.
+        candidate_links = []
+        in_section = False
+        for node in tree.css("div.Leistungen_Inhalt, a"):
+            if node.tag == "div":
+                if in_section:
+                    # text() walks the subtree; only pay for it if the log
+                    # line is actually emitted.
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Stopping at next header: {_normalize(node.text(deep=True))}")
+                    break
+                if _normalize(node.text(deep=True)) == start_text:
+                    in_section = True
+            elif in_section:
+                text = _normalize(node.text(deep=True))
+                # Pre-filter: course links always carry a numeric id, so
+                # navigational junk (PDF icons, Anmelden, ...) is dropped
+                # here before any further per-link work.
+                if _ID_RE.search(text):
+                    candidate_links.append(text)
+
+        return candidate_links
+
+    def _collect_candidates_lxml(self, html_content):
+        """lxml fallback for _collect_candidates_lexbor, reusing the
+        module-level parser fixture and precompiled XPaths."""
+        root = lxml.html.fromstring(html_content, parser=_HTML_PARSER)
 
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
         # 1. Find the start marker (Current Semester)
         start_node = None
-        
-        # Try specific user target first, then fallback to generic regex
-        target_patterns = [
-            r"Wintersemester\s*2025/26",
-            r"(Wintersemester|Sommersemester)\s*\d{4}(/\d{2})?"
-        ]
-        
-        all_headers = soup.find_all("div", class_="Leistungen_Inhalt")
-        
-        for p in target_patterns:
+        all_headers = _MARKER_XP(root)
+
+        for p in _SEMESTER_RES:
             for header in all_headers:
-                txt = normalize(header.get_text())
-                if re.search(p, txt, re.IGNORECASE):
+                txt = _normalize(header.text_content())
+                if p.search(txt):
                     start_node = header
                     logger.info(f"Found semester header: {txt}")
                     break
-            if start_node: break
-            
-        if not start_node:
-            logger.warning("Could not find current semester header (e.g. Wintersemester 2025/26)")
-            # Fallback check for old marker if new one fails
-            if "Aktuelle Veranstaltungen" in soup.get_text():
-                 logger.info("Fallback to 'Aktuelle Veranstaltungen' marker")
-                 return self._legacy_extract(soup)
-            return []
+            if start_node is not None: break
+
+        if start_node is None:
+            return None
+
+        # 2. Collect anchors until the next semester header.
+        # One XPath union gathers only the nodes we care about (semester
+        # markers and anchors, in document order) in C; Python walks just
+        # the slice between the two markers.
+        nodes = _MARKER_OR_ANCHOR_XP(root)
+        start_idx = next(i for i, n in enumerate(nodes) if n is start_node)
 
-        # 2. Collect nodes until the next semester header
-        classes = []
-        seen_names = set()
-        
-        # iterate through all elements after start_node in document order
-        # We need to be careful not to traverse the entire document if it's huge, 
-        # but LSF pages are usually reasonable.
-        # "next_elements" yields all tags and strings.
-        
-        # We want to stop at the next "Leistungen_Inhalt" div
-        
         candidate_links = []
-        
-        for element in start_node.find_all_next():
+        for element in nodes[start_idx + 1:]:
             # semantic stop condition
-            if element.name == "div" and "Leistungen_Inhalt" in element.get("class", []):
-                 logger.info(f"Stopping at next header: {normalize(element.get_text())}")
+            if element.tag == "div":
+                 # text_content() walks the subtree; skip it if INFO is off.
+                 if logger.isEnabledFor(logging.INFO):
+                     logger.info(f"Stopping at next header: {_normalize(element.text_content())}")
                  break
-            
-            if element.name == 'a':
-                candidate_links.append(element)
+            text = _normalize(element.text_content())
+            # Pre-filter: course links always carry a numeric id (see the
+            # Lexbor collector above).
+            if _ID_RE.search(text):
+                candidate_links.append(text)
 
-        # 3. Process candidates
-        for link in candidate_links:
-            link_text = normalize(link.get_text())
-            
-            is_candidate = False
-            
-            # Logic A: ID pattern
-            if re.search(r'\d{4,6}', link_text):
-                is_candidate = True
-            
-            # Junk Filters
-            junk = ["Tag", "Zeit", "Rhythmus", "Dauer", "Raum", "Lehrperson", "Hinweis", "Belegungsinformation", "findet statt", "Belegungs-", "PDF", "Stundenplan", "Anmelden", "Login", "Abmelden"]
-            if any(j.lower() in link_text.lower() for j in junk):
-                is_candidate = False
-            if len(link_text) < 5:
-                is_candidate = False
-                
-            if is_candidate:
-                if link_text not in seen_names:
-                    classes.append(link_text)
-                    seen_names.add(link_text)
-                    logger.info(f"✅ FOUND CLASS: {link_text}")
+        return candidate_links
 
-        logger.info(f"Total classes found for semester: {len(classes)}")
-        return classes
-
-    def _legacy_extract(self, soup):
+    def _legacy_extract(self, html_content):
         # Very basic fallback using old marker if needed
-        import re
-        def normalize(t): return re.sub(r'\s+', ' ', t).strip()
-        
         start_marker = "Aktuelle Veranstaltungen:"
         end_marker = "Absolvierte Veranstaltungen:"
-        
-        text = normalize(soup.get_text())
+
+        text = _normalize(lxml.html.fromstring(html_content, parser=_HTML_PARSER).text_content())
         if start_marker not in text: return []
         
         # This is hard to do without the node indices logic from before, 
         # but since we are replacing the file, let's assuming strict new logic is preferred.
         return []
 
+    def _save_cookies(self):
+        """Persist the session cookies for the cookie-first fast path."""
+        try:
+            with open(self._cookie_file, "w", encoding="utf-8") as f:
+                json.dump(self.driver.get_cookies(), f)
+        except Exception as e:
+            logger.warning(f"Could not persist LSF cookies: {e}")
+
+    def _fetch_with_saved_cookies(self):
+        """Try the lectures page with cookies from the last successful login.
+
+        Returns the HTML if the session is still valid (the response shows
+        the transcript markup), else None, meaning a browser login is needed.
+        """
+        if not os.path.exists(self._cookie_file):
+            return None
+        try:
+            with open(self._cookie_file, encoding="utf-8") as f:
+                saved = json.load(f)
+            jar = httpx.Cookies()
+            for cookie in saved:
+                jar.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''))
+            response = httpx.get(self.lsf_url, cookies=jar, timeout=20.0, follow_redirects=True)
+            if response.status_code == 200 and "Leistungen_Inhalt" in response.text:
+                logger.info("Saved session cookies still valid, skipping Selenium")
+                return response.text
+            logger.info("Saved session cookies expired, falling back to browser login")
+        except Exception as e:
+            logger.warning(f"Cookie-first fetch failed: {e}")
+        return None
+
     def get_current_classes(self):
-        """Primary orchestration for LSF fetching."""
+        """Primary orchestration for LSF fetching (cookie first, browser fallback)."""
         try:
-            self._setup_driver()
-            if not self.login():
-                return {"success": False, "error": "Login failed"}
-            
-            # Ensure we are on the lectures page
-            if "state=wscheck" not in self.driver.current_url:
-                logger.info("Navigating to lectures page...")
-                self.driver.get(self.lsf_url)
-            
-            # Attempt hybrid fetch
-            html = self._fetch_page_via_requests(self.lsf_url)
+            html = self._fetch_with_saved_cookies()
             if not html:
-                logger.warning("httpx fetch failed, using selenium source")
-                html = self.driver.page_source
-            
+                # Reuse a pooled browser when one is idle; Chrome startup
+                # costs seconds, and login() already short-circuits when the
+                # pooled session is still signed in.
+                self.driver = driver_pool.acquire(self.username)
+                if self.driver:
+                    self.wait = WebDriverWait(self.driver, 10)
+                else:
+                    self._setup_driver()
+                if not self.login():
+                    return {"success": False, "error": "Login failed"}
+
+                # Copy session cookies into httpx once; all parsing below works
+                # off httpx responses so we never pay a page_source DOM
+                # serialization on the happy path.
+                self._sync_http_client()
+                self._save_cookies()
+
+                # Ensure we are on the lectures page
+                if "state=wscheck" not in self.driver.current_url:
+                    logger.info("Navigating to lectures page...")
+                    self.driver.get(self.lsf_url)
+
+                # Attempt hybrid fetch
+                html = self._fetch_page_via_requests(self.lsf_url)
+                if not html:
+                    logger.warning("httpx fetch failed, using selenium source")
+                    html = self.driver.page_source
+
             class_names = self.extract_current_classes(html)
             
             return {
@@ -303,5 +553,32 @@ class LsfScraper(BossScraper):
             logger.error(f"LSF Scraper Error: {e}")
             return {"success": False, "error": str(e)}
         finally:
+            self._close_http_client()
             if self.driver:
-                self.driver.quit()
+                driver_pool.release(self.username, self.driver)
+                self.driver = None
+
+
+def _run_scrape(credentials):
+    """Module-level worker so it stays picklable for the process pool."""
+    try:
+        return LsfScraper(**credentials).get_current_classes()
+    finally:
+        # Each worker has its own in-process pool; quit its drivers here so
+        # tearing the executor down never orphans a Chrome+chromedriver
+        # pair. Keys are per-user anyway, so nothing reusable is lost.
+        driver_pool.drain()
+
+
+def scrape_many(credentials_list):
+    """Scrape several users concurrently, one process (and browser) each.
+
+    Selenium/WebDriver are not thread-safe, so this fans out over a
+    ProcessPoolExecutor; per-user Chrome profiles and cookie files keep
+    the workers from clashing on disk.
+    """
+    if not credentials_list:
+        return []
+    max_workers = min(len(credentials_list), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_scrape, credentials_list))
@@ -1,5 +1,8 @@
+import atexit
 import os
 import logging
+import threading
+import time
 from webdriver_manager.chrome import ChromeDriverManager
 
 logger = logging.getLogger(__name__)
@@ -24,3 +27,109 @@ def get_cached_driver_path():
             logger.error(f"Failed to install/find ChromeDriver: {e}")
             raise
     return _cached_driver_path
+
+
+class DriverPool:
+    """Pool of idle Chrome drivers, keyed (e.g. by username).
+
+    Chrome + ChromeDriver startup costs several seconds; releasing a
+    driver back here instead of quitting lets the next scrape for the
+    same key reuse the running browser (and its logged-in session).
+    Drivers idle longer than max_idle seconds, or that no longer respond,
+    are quit instead of handed out; a background reaper also quits stale
+    drivers for keys that are never acquired again, and everything left
+    is quit at interpreter exit so no headless Chrome outlives us.
+    """
+
+    def __init__(self, max_idle=600, reap_interval=60):
+        self.max_idle = max_idle
+        self.reap_interval = reap_interval
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._reaper = None
+        atexit.register(self.drain)
+
+    def acquire(self, key):
+        """Return an idle, still-alive driver for key, or None."""
+        while True:
+            with self._lock:
+                entries = self._idle.get(key)
+                if not entries:
+                    return None
+                driver, released_at = entries.pop()
+            if time.time() - released_at > self.max_idle:
+                self._quit(driver)
+                continue
+            try:
+                driver.current_url  # liveness probe
+                logger.info(f"Reusing pooled Chrome driver for {key}")
+                return driver
+            except:
+                self._quit(driver)
+
+    def release(self, key, driver):
+        if driver is None:
+            return
+        with self._lock:
+            self._idle.setdefault(key, []).append((driver, time.time()))
+        self._ensure_reaper()
+
+    def drain(self):
+        """Quit every pooled driver (shutdown / pool-worker exit)."""
+        with self._lock:
+            entries = [e for lst in self._idle.values() for e in lst]
+            self._idle.clear()
+        for driver, _ in entries:
+            self._quit(driver)
+
+    def _reset_after_fork(self):
+        """Forget inherited state in a forked child without quitting.
+
+        The inherited session handles belong to the parent's browsers;
+        quitting (or reusing) them from the child would kill or corrupt
+        the parent's warm pool. The inherited lock may also be held by a
+        parent thread at fork time, so rebuild it rather than acquire it.
+        """
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._reaper = None
+
+    def _ensure_reaper(self):
+        # Started lazily on first release so importing the module never
+        # spawns a thread; daemon so it cannot block interpreter exit.
+        if self._reaper is None or not self._reaper.is_alive():
+            self._reaper = threading.Thread(target=self._reap_loop, daemon=True, name="driver-pool-reaper")
+            self._reaper.start()
+
+    def _reap_loop(self):
+        while True:
+            time.sleep(self.reap_interval)
+            self._reap_idle()
+
+    def _reap_idle(self):
+        now = time.time()
+        stale = []
+        with self._lock:
+            for key, entries in self._idle.items():
+                fresh = [(d, t) for d, t in entries if now - t <= self.max_idle]
+                stale.extend(d for d, t in entries if now - t > self.max_idle)
+                self._idle[key] = fresh
+        for driver in stale:
+            logger.info("Quitting pooled Chrome driver after idle timeout")
+            self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except:
+            pass
+
+
+driver_pool = DriverPool()
+
+# Forked workers (ProcessPoolExecutor on Linux) inherit the parent's pool
+# dict; clear it in the child so drain()/acquire() there only ever touch
+# drivers the worker created itself.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=driver_pool._reset_after_fork)